@@ -0,0 +1,88 @@
+"""
+Small TTL + LRU cache decorator used to memoize RPC results
+that are effectively constant for a given endpoint
+"""
+import threading
+import time
+
+from collections import OrderedDict
+from functools import wraps
+
+
+def ttl_lru_cache( maxsize = 128, ttl_seconds = 3600 ):
+    """Memoize a function with a bounded LRU cache whose entries expire.
+
+    Entries are keyed on the function arguments and stored as
+    (value, expiry) pairs; expired or least-recently-used entries are
+    evicted. The lock only guards the cache bookkeeping — the wrapped
+    function runs outside it, so a slow fetch for one key (e.g. a hung
+    endpoint) never blocks callers for other keys. Concurrent misses
+    for the same key still coalesce: one caller fetches while the rest
+    wait on a per-key event and then read the cached value.
+
+    Parameters
+    ----------
+    maxsize: :obj:`int`, optional
+        Maximum number of cached entries
+    ttl_seconds: :obj:`int`, optional
+        Seconds for which a cached entry stays valid
+
+    Returns
+    -------
+    Decorator adding the cache to the wrapped function; the wrapped
+    function exposes invalidate() to drop all cached entries
+    """
+    def decorator( func ):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        in_flight = {}
+
+        @wraps( func )
+        def wrapper( *args, **kwargs ):
+            key = ( args, tuple( sorted( kwargs.items() ) ) )
+            while True:
+                with lock:
+                    entry = cache.get( key )
+                    if entry is not None:
+                        value, expiry = entry
+                        if time.monotonic() < expiry:
+                            cache.move_to_end( key )
+                            return value
+                        del cache[ key ]
+                    done = in_flight.get( key )
+                    if done is None:
+                        done = threading.Event()
+                        in_flight[ key ] = done
+                        break
+                # another caller is already fetching this key: wait,
+                # then re-check the cache (and fetch ourselves if the
+                # owning call failed)
+                done.wait()
+            try:
+                value = func( *args, **kwargs )
+            except BaseException:
+                with lock:
+                    if in_flight.get( key ) is done:
+                        del in_flight[ key ]
+                done.set()
+                raise
+            # publish the value before waking waiters, so they cannot
+            # observe an empty cache and issue a duplicate fetch
+            with lock:
+                cache[ key ] = ( value, time.monotonic() + ttl_seconds )
+                while len( cache ) > maxsize:
+                    cache.popitem( last = False )
+                if in_flight.get( key ) is done:
+                    del in_flight[ key ]
+            done.set()
+            return value
+
+        def invalidate():
+            """Drop all cached entries."""
+            with lock:
+                cache.clear()
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
@@ -0,0 +1,36 @@
+"""
+JSON serialization shim: orjson when installed, stdlib json otherwise
+Install with `pip install pyitc[perf]` for the fast path
+"""
+import json
+
+try:
+    import simdjson
+
+    def lazy_loads( data ):
+        """Parse JSON bytes into a lazy pysimdjson document proxy.
+
+        Values are materialized only for the keys actually touched,
+        which is a large win on multi-megabyte block responses where
+        callers read a few fields per block. Each call gets its own
+        parser — a pysimdjson parser serves one live document, and a
+        shared one would refuse to re-parse while any earlier proxy is
+        still referenced — so proxies stay valid for as long as the
+        caller holds them, at the cost of one parser allocation per
+        call.
+        """
+        return simdjson.Parser().parse( data )
+except ImportError:  # optional, plain loads covers everything
+    lazy_loads = None
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:  # optional, stdlib json works fine without it
+    loads = json.loads
+
+    def dumps( obj ) -> bytes:
+        """Serialize obj to JSON bytes (stdlib fallback)."""
+        return json.dumps( obj ).encode()
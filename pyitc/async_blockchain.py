@@ -0,0 +1,168 @@
+"""
+Async variants of the blockchain getters
+Generated from the same method metadata table that drives the sync
+module, so the two APIs cannot drift; backed by the shared httpx
+client, one asyncio.gather pipelines hundreds of RPCs over a single
+multiplexed connection. Install with `pip install pyitc[async]`.
+This is the recommended API for indexers and bots; threads via the
+sync helpers remain available for everything else.
+"""
+from .rpc.async_request import arpc_request
+
+from .blockchain import (
+    _RPC_METHODS,
+    _opts_dict,
+    BlockFetchOpts,
+    aget_block_by_number,
+)
+
+from .exceptions import InvalidRPCReplyError
+
+from .constants import DEFAULT_ENDPOINT, DEFAULT_TIMEOUT
+
+# sentinel distinguishing an absent result field from a null result
+_MISSING = object()
+
+
+async def _acall( method, endpoint, timeout, params = None, cast = None ):
+    """Async twin of blockchain._call.
+
+    Sends the request over the shared async client and returns the
+    (optionally cast) result; a missing or malformed result is
+    reported as InvalidRPCReplyError, like the sync getters.
+    """
+    reply = await arpc_request( method,
+                                params = params,
+                                endpoint = endpoint,
+                                timeout = timeout )
+    result = reply.get( "result", _MISSING )
+    if result is _MISSING:
+        raise InvalidRPCReplyError( method, endpoint )
+    try:
+        return cast( result ) if cast is not None else result
+    except ( TypeError, ValueError ) as exception:
+        raise InvalidRPCReplyError( method, endpoint ) from exception
+
+
+def _make_async_getter( name, method, cast, arity ):
+    """Build the async twin of the sync getter called name."""
+    if arity == 0:
+
+        async def getter(
+            endpoint = DEFAULT_ENDPOINT,
+            timeout = DEFAULT_TIMEOUT
+        ):
+            return await _acall( method, endpoint, timeout, cast = cast )
+    else:
+
+        async def getter(
+            *args,
+            endpoint = DEFAULT_ENDPOINT,
+            timeout = DEFAULT_TIMEOUT
+        ):
+            if len( args ) != arity:
+                raise TypeError(
+                    f"{name}() takes {arity} positional "
+                    f"argument(s) but {len( args )} were given"
+                )
+            return await _acall( method,
+                                 endpoint,
+                                 timeout,
+                                 params = list( args ),
+                                 cast = cast )
+
+    getter.__name__ = name
+    getter.__qualname__ = name
+    getter.__doc__ = (
+        f"Async variant of pyitc.blockchain.{name}; see that function "
+        "for parameters and reply structure."
+    )
+    return getter
+
+
+for _name, ( _method, _cast, _arity ) in _RPC_METHODS.items():
+    globals()[ _name ] = _make_async_getter( _name, _method, _cast, _arity )
+del _name, _method, _cast, _arity
+
+
+async def get_block_by_number( # pylint: disable=too-many-arguments
+    block_num,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+) -> dict:
+    """Async variant of pyitc.blockchain.get_block_by_number; see that
+    function for parameters and reply structure."""
+    return await aget_block_by_number(
+        block_num,
+        full_tx = full_tx,
+        include_tx = include_tx,
+        include_staking_tx = include_staking_tx,
+        include_signers = include_signers,
+        endpoint = endpoint,
+        timeout = timeout,
+    )
+
+
+async def get_block_by_hash( # pylint: disable=too-many-arguments
+    block_hash,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+) -> dict:
+    """Async variant of pyitc.blockchain.get_block_by_hash; see that
+    function for parameters and reply structure."""
+    params = [
+        block_hash,
+        _opts_dict(
+            BlockFetchOpts(
+                full_tx,
+                include_tx,
+                include_staking_tx,
+                include_signers
+            )
+        ),
+    ]
+    method = "itcv2_getBlockByHash"
+    return await _acall( method, endpoint, timeout, params = params )
+
+
+async def get_blocks( # pylint: disable=too-many-arguments
+    start_block,
+    end_block,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+) -> list:
+    """Async variant of pyitc.blockchain.get_blocks; see that function
+    for parameters and reply structure."""
+    params = [
+        start_block,
+        end_block,
+        _opts_dict(
+            BlockFetchOpts(
+                full_tx,
+                include_tx,
+                include_staking_tx,
+                include_signers
+            )
+        ),
+    ]
+    method = "itcv2_getBlocks"
+    return await _acall( method, endpoint, timeout, params = params )
+
+
+__all__ = list( _RPC_METHODS ) + [
+    "get_block_by_number",
+    "get_block_by_hash",
+    "get_blocks",
+]
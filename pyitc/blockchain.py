@@ -3,13 +3,213 @@ Interact with the intelchain blockchain to fetch
 blocks, headers, transaction pool, node status, etc.
 """
 # pylint: disable=too-many-lines
-from .rpc.request import rpc_request
+import asyncio
+import itertools
+import os
+import sys
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .rpc.request import (
+    rpc_request,
+    rpc_result,
+    _call0,
+    rpc_batch_request,
+    base_request,
+    base_request_stream,
+    _to_int,
+    _to_bool,
+)
+
+try:
+    import ijson
+except ImportError:  # optional, used for streamed parsing only
+    ijson = None
+
+from .rpc.async_request import arpc_request
+
+from .rpc.exceptions import RPCError, RequestsError
+
+from ._cache import ttl_lru_cache
+
+from ._serialization import lazy_loads as _lazy_loads
 
 from .exceptions import InvalidRPCReplyError
 
 from .constants import DEFAULT_ENDPOINT, DEFAULT_TIMEOUT
 
 
+# pre-encoded params template for hot single-int-argument getters;
+# base_request splices the bytes in without another JSON pass
+_INT_PARAMS = b"[%d]"
+
+def _norm_addr( address ) -> str:
+    """Canonical (lower-case, interned) form of an address string.
+
+    Interned strings hash and compare by identity in CPython, so the
+    signer-set membership tests and cache keys built from addresses
+    skip the per-character work on repeats.
+    """
+    return sys.intern( address.lower() )
+
+
+_history_cache = OrderedDict()
+_history_cache_lock = threading.Lock()
+_HISTORY_CACHE_MAX = 1024
+
+
+def _history_lookup( key, fetch ):
+    """Serve an immutable historical result from the bounded cache.
+
+    Used for queries whose answer can never change (a closed epoch's
+    last block, whether a past block ended its epoch); entries never
+    expire and are evicted least-recently-used once the cache is full.
+    """
+    with _history_cache_lock:
+        if key in _history_cache:
+            _history_cache.move_to_end( key )
+            return _history_cache[ key ]
+    value = fetch()
+    with _history_cache_lock:
+        _history_cache[ key ] = value
+        while len( _history_cache ) > _HISTORY_CACHE_MAX:
+            _history_cache.popitem( last = False )
+    return value
+
+
+def clear_history_cache():
+    """Drop all cached historical epoch/block results."""
+    with _history_cache_lock:
+        _history_cache.clear()
+
+
+def clear_cache():
+    """Drop every client-side cache kept by this module.
+
+    Covers the historical-result cache and all TTL-cached getters;
+    mainly useful in tests and long-lived processes that switch
+    endpoints.
+    """
+    clear_history_cache()
+    for cached in (
+            chain_id,
+            get_sharding_structure,
+            _fetch_node_metadata,
+            _current_block_number,
+            _current_epoch,
+            _fetch_block_by_hash,
+            _fetch_block_signers,
+            _signer_set,
+            _fetch_block_signer_keys,
+            _fetch_validators,
+            _fetch_validator_keys,
+    ):
+        cached.invalidate()
+
+
+@dataclass( frozen = True )
+class BlockFetchOpts:
+    """Flags controlling what block getters include in their reply.
+
+    Frozen (hence hashable) so the params dict for each of the 16 flag
+    combinations can be built once and shared across calls.
+    """
+    full_tx: bool = False
+    include_tx: bool = False
+    include_staking_tx: bool = False
+    include_signers: bool = False
+
+
+@lru_cache( maxsize = 16 )
+def _opts_dict( opts ) -> dict:
+    """Shared RPC params dict for the given BlockFetchOpts."""
+    return {
+        "inclTx": opts.include_tx,
+        "fullTx": opts.full_tx,
+        "inclStaking": opts.include_staking_tx,
+        "withSigners": opts.include_signers,
+    }
+
+
+# shared all-flags-off options dict and its pre-encoded params
+# template: the overwhelmingly common get_block_by_number(n) call
+# becomes a bytes substitution with no dict or dataclass built at all
+_DEFAULT_BLOCK_OPTS = _opts_dict( BlockFetchOpts() )
+_DEFAULT_BLOCK_PARAMS = (
+    b'[%d, {"inclTx": false, "fullTx": false,'
+    b' "inclStaking": false, "withSigners": false}]'
+)
+
+
+def _stream_result_items( stream, method, endpoint ):
+    """Yield items of a streamed reply's result array incrementally.
+
+    ijson.items alone yields nothing for an error or missing-result
+    envelope, making a failed call look like an empty range; this
+    walks the parse events instead and raises InvalidRPCReplyError
+    when the reply carries no result array.
+    """
+    events = ijson.parse( stream )
+    for prefix, event, value in events:
+        if prefix == "result" and event == "start_array":
+            yield from ijson.common.items(
+                itertools.chain( [ ( prefix, event, value ) ], events ),
+                "result.item"
+            )
+            return
+        if prefix == "result":  # present but not an array
+            break
+    raise InvalidRPCReplyError( method, endpoint )
+
+
+def _call( method, endpoint, timeout, params = None, cast = None ):
+    """Send an RPC request and return (optionally cast) its result.
+
+    Shared body of every getter in this module: any missing or
+    malformed result is reported as InvalidRPCReplyError, keeping the
+    public functions down to one line each.
+
+    Parameters
+    ----------
+    method: :obj:`str`
+        RPC method to call
+    endpoint: :obj:`str`
+        Endpoint to send request to
+    timeout: :obj:`int`
+        Timeout in seconds
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    cast: callable, optional
+        Conversion applied to the result, for example _to_int or bool
+
+    Returns
+    -------
+    The result field of the RPC response, converted by cast if given
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+    """
+    try:
+        if params is None:
+            result = _call0( method, endpoint, timeout )
+        else:
+            result = rpc_result(
+                method,
+                params = params,
+                endpoint = endpoint,
+                timeout = timeout
+            )
+        return cast( result ) if cast is not None else result
+    except ( KeyError, TypeError, ValueError ) as exception:
+        raise InvalidRPCReplyError( method, endpoint ) from exception
+
+
 #############################
 # Node / network level RPCs #
 #############################
@@ -41,14 +241,10 @@ def get_bad_blocks(
     https://api.intelchain.org/#0ba3c7b6-6aa9-46b8-9c84-f8782e935951
     """
     method = "itcv2_getCurrentBadBlocks"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
+@ttl_lru_cache( maxsize = 8, ttl_seconds = 3600 )
 def chain_id( endpoint = DEFAULT_ENDPOINT, timeout = DEFAULT_TIMEOUT ) -> dict:
     """Chain id of the chain.
 
@@ -73,11 +269,7 @@ def chain_id( endpoint = DEFAULT_ENDPOINT, timeout = DEFAULT_TIMEOUT ) -> dict:
     https://github.com/zennittians/intelchain/blob/343dbe89b3c105f8104ab877769070ba6fdd0133/rpc/blockchain.go#L44
     """
     method = "itcv2_chainId"
-    try:
-        data = rpc_request( method, endpoint = endpoint, timeout = timeout )
-        return data[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
 def get_node_metadata(
@@ -135,11 +327,25 @@ def get_node_metadata(
     https://github.com/zennittians/intelchain/blob/9f320436ff30d9babd957bc5f2e15a1818c86584/node/api.go#L110
     """
     method = "itcv2_getNodeMetadata"
-    try:
-        metadata = rpc_request( method, endpoint = endpoint, timeout = timeout )
-        return metadata[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
+
+
+@ttl_lru_cache( maxsize = 8, ttl_seconds = 3600 )
+def _fetch_node_metadata( endpoint, timeout ) -> dict:
+    """Fetch (and cache) node metadata shared by the chain-config getters.
+
+    get_staking_epoch, get_prestaking_epoch and get_shard all read from
+    the same itcv2_getNodeMetadata reply; routing them through this one
+    cached fetch means callers needing several of those values pay a
+    single round-trip. The cache lock also coalesces concurrent misses
+    into one in-flight request.
+
+    See also
+    --------
+    get_node_metadata
+    """
+    method = "itcv2_getNodeMetadata"
+    return _call( method, endpoint, timeout )
 
 
 def get_peer_info(
@@ -176,12 +382,7 @@ def get_peer_info(
     get_node_metadata
     """
     method = "itcv2_getPeerInfo"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
 def protocol_version(
@@ -212,11 +413,7 @@ def protocol_version(
     https://api.intelchain.org/#cab9fcc2-e3cd-4bc9-b62a-13e4e046e2fd
     """
     method = "itcv2_protocolVersion"
-    try:
-        value = rpc_request( method, endpoint = endpoint, timeout = timeout )
-        return value[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
 def get_num_peers(
@@ -247,15 +444,7 @@ def get_num_peers(
     https://api.intelchain.org/#09287e0b-5b61-4d18-a0f1-3afcfc3369c1
     """
     method = "net_peerCount"
-    try:  # Number of peers represented as a hex string
-        return int(
-            rpc_request( method,
-                         endpoint = endpoint,
-                         timeout = timeout )[ "result" ],
-            16
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, cast = _to_int )
 
 
 def get_version(
@@ -286,15 +475,7 @@ def get_version(
     https://api.intelchain.org/#09287e0b-5b61-4d18-a0f1-3afcfc3369c1
     """
     method = "net_version"
-    try:
-        return int(
-            rpc_request( method,
-                         endpoint = endpoint,
-                         timeout = timeout )[ "result" ],
-            16
-        )  # this is hexadecimal
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, cast = _to_int )
 
 
 def in_sync( endpoint = DEFAULT_ENDPOINT, timeout = DEFAULT_TIMEOUT ) -> bool:
@@ -321,14 +502,7 @@ def in_sync( endpoint = DEFAULT_ENDPOINT, timeout = DEFAULT_TIMEOUT ) -> bool:
     https://github.com/zennittians/intelchain/blob/1a8494c069dc3f708fdf690456713a2411465199/rpc/blockchain.go#L690
     """
     method = "itcv2_inSync"
-    try:
-        return bool(
-            rpc_request( method,
-                         endpoint = endpoint,
-                         timeout = timeout )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, cast = _to_bool )
 
 
 def beacon_in_sync(
@@ -358,14 +532,7 @@ def beacon_in_sync(
     https://github.com/zennittians/intelchain/blob/1a8494c069dc3f708fdf690456713a2411465199/rpc/blockchain.go#L695
     """
     method = "itcv2_beaconInSync"
-    try:
-        return bool(
-            rpc_request( method,
-                         endpoint = endpoint,
-                         timeout = timeout )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, cast = _to_bool )
 
 
 def get_staking_epoch(
@@ -400,10 +567,8 @@ def get_staking_epoch(
     get_node_metadata
     """
     method = "itcv2_getNodeMetadata"
+    data = _fetch_node_metadata( endpoint, timeout )
     try:
-        data = rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
         return int( data[ "chain-config" ][ "staking-epoch" ] )
     except ( KeyError, TypeError ) as exception:
         raise InvalidRPCReplyError( method, endpoint ) from exception
@@ -442,15 +607,64 @@ def get_prestaking_epoch(
     get_node_metadata
     """
     method = "itcv2_getNodeMetadata"
+    data = _fetch_node_metadata( endpoint, timeout )
     try:
-        data = rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
         return int( data[ "chain-config" ][ "prestaking-epoch" ] )
     except ( KeyError, TypeError ) as exception:
         raise InvalidRPCReplyError( method, endpoint ) from exception
 
 
+@dataclass( frozen = True )
+class EpochConfig:
+    """Epoch-related chain configuration, read in one metadata fetch."""
+    staking_epoch: int
+    prestaking_epoch: int
+    chain_id: int
+
+
+def get_epoch_config(
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+) -> EpochConfig:
+    """Get the staking/prestaking epochs & chain id in one fetch.
+
+    Callers wanting several of these values (staking UIs typically
+    read both epochs back-to-back) would otherwise pay one node
+    metadata round-trip per getter.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    EpochConfig with staking_epoch, prestaking_epoch and chain_id
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    get_staking_epoch, get_prestaking_epoch, chain_id
+    """
+    method = "itcv2_getNodeMetadata"
+    data = _fetch_node_metadata( endpoint, timeout )
+    try:
+        chain_config = data[ "chain-config" ]
+        return EpochConfig(
+            int( chain_config[ "staking-epoch" ] ),
+            int( chain_config[ "prestaking-epoch" ] ),
+            int( chain_config[ "chain-id" ] ),
+        )
+    except ( KeyError, TypeError ) as exception:
+        raise InvalidRPCReplyError( method, endpoint ) from exception
+
+
 ########################
 # Sharding information #
 ########################
@@ -480,13 +694,12 @@ def get_shard( endpoint = DEFAULT_ENDPOINT, timeout = DEFAULT_TIMEOUT ) -> int:
     """
     method = "itcv2_getNodeMetadata"
     try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ][ "shard-id" ]
+        return _fetch_node_metadata( endpoint, timeout )[ "shard-id" ]
     except KeyError as exception:
         raise InvalidRPCReplyError( method, endpoint ) from exception
 
 
+@ttl_lru_cache( maxsize = 8, ttl_seconds = 3600 )
 def get_sharding_structure(
     endpoint = DEFAULT_ENDPOINT,
     timeout = DEFAULT_TIMEOUT
@@ -518,12 +731,7 @@ def get_sharding_structure(
     https://api.intelchain.org/#9669d49e-43c1-47d9-a3fd-e7786e5879df
     """
     method = "itcv2_getShardingStructure"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
 #############################
@@ -557,12 +765,19 @@ def get_leader_address(
     https://api.intelchain.org/#8b08d18c-017b-4b44-a3c3-356f9c12dacd
     """
     method = "itcv2_getLeader"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
+
+
+@ttl_lru_cache( maxsize = 8, ttl_seconds = 5 )
+def _current_block_number( endpoint, timeout ) -> int:
+    """Current block number with a short TTL, for historical checks."""
+    return _call( "itcv2_blockNumber", endpoint, timeout, cast = _to_int )
+
+
+@ttl_lru_cache( maxsize = 8, ttl_seconds = 5 )
+def _current_epoch( endpoint, timeout ) -> int:
+    """Current epoch number with a short TTL, for historical checks."""
+    return _call( "itcv2_getEpoch", endpoint, timeout, cast = _to_int )
 
 
 def is_last_block(
@@ -594,19 +809,18 @@ def is_last_block(
     -------------
     https://github.com/zennittians/intelchain/blob/1a8494c069dc3f708fdf690456713a2411465199/rpc/blockchain.go#L286
     """
-    params = [ block_num, ]
     method = "itcv2_isLastBlock"
-    try:
-        return bool(
-            rpc_request(
-                method,
-                params = params,
-                endpoint = endpoint,
-                timeout = timeout
-            )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+
+    def fetch():
+        return _call( method,
+                      endpoint,
+                      timeout,
+                      params = [ block_num, ],
+                      cast = _to_bool )
+
+    if block_num < _current_block_number( endpoint, timeout ):
+        return _history_lookup( ( method, endpoint, block_num ), fetch )
+    return fetch()
 
 
 def epoch_last_block(
@@ -638,19 +852,18 @@ def epoch_last_block(
     -------------
     https://github.com/zennittians/intelchain/blob/1a8494c069dc3f708fdf690456713a2411465199/rpc/blockchain.go#L294
     """
-    params = [ epoch, ]
     method = "itcv2_epochLastBlock"
-    try:
-        return int(
-            rpc_request(
-                method,
-                params = params,
-                endpoint = endpoint,
-                timeout = timeout
-            )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+
+    def fetch():
+        return _call( method,
+                      endpoint,
+                      timeout,
+                      params = [ epoch, ],
+                      cast = _to_int )
+
+    if epoch < _current_epoch( endpoint, timeout ):
+        return _history_lookup( ( method, endpoint, epoch ), fetch )
+    return fetch()
 
 
 def get_circulating_supply(
@@ -681,12 +894,7 @@ def get_circulating_supply(
     https://api.intelchain.org/#8398e818-ac2d-4ad8-a3b4-a00927395044
     """
     method = "itcv2_getCirculatingSupply"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
 def get_total_supply(
@@ -717,12 +925,7 @@ def get_total_supply(
     https://api.intelchain.org/#3dcea518-9e9a-4a20-84f4-c7a0817b2196
     """
     method = "itcv2_getTotalSupply"
-    try:
-        rpc_request( method,
-                     endpoint = endpoint,
-                     timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
 def get_block_number(
@@ -753,14 +956,7 @@ def get_block_number(
     https://api.intelchain.org/#2602b6c4-a579-4b7c-bce8-85331e0db1a7
     """
     method = "itcv2_blockNumber"
-    try:
-        return int(
-            rpc_request( method,
-                         endpoint = endpoint,
-                         timeout = timeout )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, cast = _to_int )
 
 
 def get_current_epoch(
@@ -791,19 +987,13 @@ def get_current_epoch(
     https://api.intelchain.org/#9b8e98b0-46d1-4fa0-aaa6-317ff1ddba59
     """
     method = "itcv2_getEpoch"
-    try:
-        return int(
-            rpc_request( method,
-                         endpoint = endpoint,
-                         timeout = timeout )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, cast = _to_int )
 
 
 def get_last_cross_links(
     endpoint = DEFAULT_ENDPOINT,
-    timeout = DEFAULT_TIMEOUT
+    timeout = DEFAULT_TIMEOUT,
+    raw = False
 ) -> list:
     """Get last cross shard links.
 
@@ -813,6 +1003,8 @@ def get_last_cross_links(
         Endpoint to send request to
     timeout: :obj:`int`, optional
         Timeout in seconds
+    raw: :obj:`bool`, optional
+        Return the undecoded response body instead of the parsed list
 
     Returns
     -------
@@ -825,6 +1017,7 @@ def get_last_cross_links(
         signature-bitmap: :obj:`str` Hex representation of aggregated signature bitmap
         shard-id: :obj:`str` (other) shard ID
         epoch-number: :obj:`int` Block epoch
+    if raw is True, the undecoded response body is returned as bytes
 
     Raises
     ------
@@ -836,12 +1029,47 @@ def get_last_cross_links(
     https://api.intelchain.org/#4994cdf9-38c4-4b1d-90a8-290ddaa3040e
     """
     method = "itcv2_getLastCrossLinks"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    if raw:
+        return base_request( method, endpoint = endpoint, timeout = timeout )
+    return _call( method, endpoint, timeout )
+
+
+def iter_cross_links(
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+):
+    """Yield last cross shard links one at a time.
+
+    With the optional ijson package installed the response body is
+    parsed incrementally while it streams in, so one cross link is
+    materialized at a time instead of the whole list; without it this
+    falls back to get_last_cross_links and yields from the parsed
+    reply.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Yields
+    ------
+    dict per cross link, see get_last_cross_links for the structure
+
+    See also
+    --------
+    get_last_cross_links
+    """
+    if ijson is None:
+        yield from get_last_cross_links( endpoint = endpoint,
+                                         timeout = timeout )
+        return
+    method = "itcv2_getLastCrossLinks"
+    stream = base_request_stream( method,
+                                  endpoint = endpoint,
+                                  timeout = timeout )
+    yield from _stream_result_items( stream, method, endpoint )
 
 
 def get_gas_price(
@@ -872,14 +1100,7 @@ def get_gas_price(
     https://api.intelchain.org/#1d53fd59-a89f-436c-a171-aec9d9623f48
     """
     method = "itcv2_gasPrice"
-    try:
-        return int(
-            rpc_request( method,
-                         endpoint = endpoint,
-                         timeout = timeout )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, cast = _to_int )
 
 
 ##############
@@ -931,12 +1152,7 @@ def get_latest_header(
     https://api.intelchain.org/#73fc9b97-b048-4b85-8a93-4d2bf1da54a6
     """
     method = "itcv2_latestHeader"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout )
 
 
 def get_header_by_number(
@@ -969,21 +1185,65 @@ def get_header_by_number(
     https://api.intelchain.org/#01148e4f-72bb-426d-a123-718a161eaec0
     """
     method = "itcv2_getHeaderByNumber"
-    params = [ block_num ]
+    params = _INT_PARAMS % block_num if type(
+        block_num
+    ) is int else [ block_num ]
+    return _call( method, endpoint, timeout, params = params )
+
+
+def get_headers_by_numbers(
+    block_nums,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = 20
+) -> list:
+    """Get block headers for each of the given block numbers.
+
+    All headers are fetched in a single JSON-RPC batch request instead
+    of one round-trip per block.
+
+    Parameters
+    ----------
+    block_nums: :obj:`list` of :obj:`int`
+        Numbers of the blocks whose headers are requested
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of calls per HTTP request
+
+    Returns
+    -------
+    list of headers, see get_latest_header for header structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    get_header_by_number
+    """
+    method = "itcv2_getHeaderByNumber"
+    calls = [ ( method, [ block_num ] ) for block_num in block_nums ]
     try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
+        return [
+            reply[ "result" ]
+            for reply in rpc_batch_request( calls,
+                                            endpoint = endpoint,
+                                            timeout = timeout,
+                                            max_batch = batch_size )
+        ]
     except KeyError as exception:
         raise InvalidRPCReplyError( method, endpoint ) from exception
 
 
 def get_latest_chain_headers(
     endpoint = DEFAULT_ENDPOINT,
-    timeout = DEFAULT_TIMEOUT
+    timeout = DEFAULT_TIMEOUT,
+    raw = False
 ) -> dict:
     """Get block header of latest block for beacon chain & shard chain.
 
@@ -993,6 +1253,8 @@ def get_latest_chain_headers(
         Endpoint to send request to
     timeout: :obj:`int`, optional
         Timeout in seconds
+    raw: :obj:`bool`, optional
+        Return the undecoded response body instead of the parsed dict
 
     Returns
     -------
@@ -1018,6 +1280,7 @@ def get_latest_chain_headers(
             timestamp: legacy
             transactionsRoot: legacy
             viewID: View ID
+    if raw is True, the undecoded response body is returned as bytes
 
     Raises
     ------
@@ -1029,12 +1292,9 @@ def get_latest_chain_headers(
     https://api.intelchain.org/#7625493d-16bf-4611-8009-9635d063b4c0
     """
     method = "itcv2_getLatestChainHeaders"
-    try:
-        return rpc_request( method,
-                            endpoint = endpoint,
-                            timeout = timeout )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    if raw:
+        return base_request( method, endpoint = endpoint, timeout = timeout )
+    return _call( method, endpoint, timeout )
 
 
 def get_block_by_number( # pylint: disable=too-many-arguments
@@ -1107,48 +1367,39 @@ def get_block_by_number( # pylint: disable=too-many-arguments
     -------------
     https://api.intelchain.org/#52f8a4ce-d357-46f1-83fd-d100989a8243
     """
+    method = "itcv2_getBlockByNumber"
+    if not ( full_tx or include_tx or include_staking_tx or
+             include_signers ):
+        params = _DEFAULT_BLOCK_PARAMS % block_num if type(
+            block_num
+        ) is int else [ block_num, _DEFAULT_BLOCK_OPTS ]
+        return _call( method, endpoint, timeout, params = params )
     params = [
         block_num,
-        {
-            "inclTx": include_tx,
-            "fullTx": full_tx,
-            "inclStaking": include_staking_tx,
-            "withSigners": include_signers,
-        },
+        _opts_dict(
+            BlockFetchOpts(
+                full_tx,
+                include_tx,
+                include_staking_tx,
+                include_signers
+            )
+        ),
     ]
-    method = "itcv2_getBlockByNumber"
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, params = params )
 
 
-def get_block_by_hash( # pylint: disable=too-many-arguments
-    block_hash,
-    full_tx=False,
-    include_tx=False,
-    include_staking_tx=False,
-    include_signers=False,
-    endpoint=DEFAULT_ENDPOINT,
-    timeout=DEFAULT_TIMEOUT,
+def get_chain_status(
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
 ) -> dict:
-    """Get block by hash.
+    """Get latest header, chain headers & cross links in one round-trip.
+
+    The three getters are commonly requested together to render shard
+    and beacon status; this sends them as a single JSON-RPC batch
+    instead of three sequential calls.
 
     Parameters
     ----------
-    block_hash: :obj:`str`
-        Block hash to fetch
-    full_tx: :obj:`bool`, optional
-        Include full transactions data for the block
-    include_tx: :obj:`bool`, optional
-        Include regular transactions for the block
-    include_staking_tx: :obj:`bool`, optional
-        Include staking transactions for the block
     endpoint: :obj:`str`, optional
         Endpoint to send request to
     timeout: :obj:`int`, optional
@@ -1156,38 +1407,479 @@ def get_block_by_hash( # pylint: disable=too-many-arguments
 
     Returns
     -------
-    See get_block_by_number for block structure
+    dict with the following keys:
+        latest_header: :obj:`dict`, see get_latest_header
+        chain_headers: :obj:`dict`, see get_latest_chain_headers
+        cross_links: :obj:`list`, see get_last_cross_links
 
     Raises
     ------
     InvalidRPCReplyError
         If received unknown result from endpoint
 
-    API Reference
-    -------------
-    https://api.intelchain.org/#6a49ec47-1f74-4732-9f04-e5d76160bd5c
+    See also
+    --------
+    get_latest_header, get_latest_chain_headers, get_last_cross_links
     """
-    params = [
-        block_hash,
-        {
-            "inclTx": include_tx,
-            "fullTx": full_tx,
-            "inclStaking": include_staking_tx,
-            "withSigners": include_signers,
-        },
+    calls = [
+        ( "itcv2_latestHeader", [] ),
+        ( "itcv2_getLatestChainHeaders", [] ),
+        ( "itcv2_getLastCrossLinks", [] ),
     ]
-    method = "itcv2_getBlockByHash"
     try:
-        return rpc_request(
+        replies = rpc_batch_request( calls,
+                                     endpoint = endpoint,
+                                     timeout = timeout )
+        return {
+            "latest_header": replies[ 0 ][ "result" ],
+            "chain_headers": replies[ 1 ][ "result" ],
+            "cross_links": replies[ 2 ][ "result" ],
+        }
+    except ( KeyError, IndexError ) as exception:
+        raise InvalidRPCReplyError( str( [ call[ 0 ] for call in calls ] ),
+                                    endpoint ) from exception
+
+
+# Getter metadata: public name -> ( RPC method, result cast, arity ).
+# Covers every getter whose params are just its positional arguments in
+# order; dispatch-style consumers (snapshot, batching, async variants)
+# read from here instead of growing their own method tables.
+_RPC_METHODS = {
+    "get_bad_blocks": ( "itcv2_getCurrentBadBlocks", None, 0 ),
+    "chain_id": ( "itcv2_chainId", None, 0 ),
+    "get_node_metadata": ( "itcv2_getNodeMetadata", None, 0 ),
+    "get_peer_info": ( "itcv2_getPeerInfo", None, 0 ),
+    "protocol_version": ( "itcv2_protocolVersion", None, 0 ),
+    "get_num_peers": ( "net_peerCount", _to_int, 0 ),
+    "get_version": ( "net_version", _to_int, 0 ),
+    "in_sync": ( "itcv2_inSync", _to_bool, 0 ),
+    "beacon_in_sync": ( "itcv2_beaconInSync", _to_bool, 0 ),
+    "get_sharding_structure": ( "itcv2_getShardingStructure", None, 0 ),
+    "get_leader_address": ( "itcv2_getLeader", None, 0 ),
+    "get_circulating_supply": ( "itcv2_getCirculatingSupply", None, 0 ),
+    "get_total_supply": ( "itcv2_getTotalSupply", None, 0 ),
+    "get_block_number": ( "itcv2_blockNumber", _to_int, 0 ),
+    "get_current_epoch": ( "itcv2_getEpoch", _to_int, 0 ),
+    "get_last_cross_links": ( "itcv2_getLastCrossLinks", None, 0 ),
+    "get_gas_price": ( "itcv2_gasPrice", _to_int, 0 ),
+    "get_latest_header": ( "itcv2_latestHeader", None, 0 ),
+    "get_latest_chain_headers": ( "itcv2_getLatestChainHeaders", None, 0 ),
+    "get_header_by_number": ( "itcv2_getHeaderByNumber", None, 1 ),
+    "get_block_transaction_count_by_number":
+        ( "itcv2_getBlockTransactionCountByNumber", int, 1 ),
+    "get_block_transaction_count_by_hash":
+        ( "itcv2_getBlockTransactionCountByHash", int, 1 ),
+    "get_block_staking_transaction_count_by_number":
+        ( "itcv2_getBlockStakingTransactionCountByNumber", int, 1 ),
+    "get_block_staking_transaction_count_by_hash":
+        ( "itcv2_getBlockStakingTransactionCountByHash", int, 1 ),
+    "get_block_signers": ( "itcv2_getBlockSigners", None, 1 ),
+    "get_block_signers_keys": ( "itcv2_getBlockSignerKeys", None, 1 ),
+    "get_signed_blocks": ( "itcv2_getSignedBlocks", int, 1 ),
+    "get_validators": ( "itcv2_getValidators", None, 1 ),
+    "get_validator_keys": ( "itcv2_getValidatorKeys", None, 1 ),
+    "is_block_signer": ( "itcv2_isBlockSigner", None, 2 ),
+}
+
+# Interned method names hash and compare by identity in the payload
+# template and dispatch dicts. CPython happens to intern these
+# identifier-like literals already; doing it explicitly makes the
+# guarantee hold regardless of how the table is built or extended.
+_RPC_METHODS = {
+    name: ( sys.intern( method ), cast, arity )
+    for name, ( method, cast, arity ) in _RPC_METHODS.items()
+}
+
+_SNAPSHOT_CALLS = tuple(
+    ( key, ) + _RPC_METHODS[ name ][ : 2 ] for key,
+    name in (
+        ( "block_number", "get_block_number" ),
+        ( "epoch", "get_current_epoch" ),
+        ( "gas_price", "get_gas_price" ),
+        ( "in_sync", "in_sync" ),
+        ( "beacon_in_sync", "beacon_in_sync" ),
+        ( "num_peers", "get_num_peers" ),
+        ( "leader", "get_leader_address" ),
+    )
+)
+
+
+def snapshot(
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch = True
+) -> dict:
+    """Get a status snapshot of the node in one round-trip.
+
+    Collects the readings a poller typically wants (block number,
+    epoch, gas price, sync flags, peer count, leader) as a single
+    JSON-RPC batch, or over a small thread pool for endpoints that do
+    not support batching.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch: :obj:`bool`, optional
+        Use one batch request instead of parallel single requests
+
+    Returns
+    -------
+    dict with the following keys:
+        block_number: :obj:`int`, see get_block_number
+        epoch: :obj:`int`, see get_current_epoch
+        gas_price: :obj:`int`, see get_gas_price
+        in_sync: :obj:`bool`, see in_sync
+        beacon_in_sync: :obj:`bool`, see beacon_in_sync
+        num_peers: :obj:`int`, see get_num_peers
+        leader: :obj:`str`, see get_leader_address
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    StatusPoller
+    """
+    if batch:
+        calls = [ ( method, [] ) for _, method, _ in _SNAPSHOT_CALLS ]
+        try:
+            replies = rpc_batch_request( calls,
+                                         endpoint = endpoint,
+                                         timeout = timeout )
+            return {
+                key:
+                cast( reply[ "result" ] ) if cast else reply[ "result" ]
+                for ( key, _, cast ),
+                reply in zip( _SNAPSHOT_CALLS, replies )
+            }
+        except ( KeyError, TypeError, ValueError ) as exception:
+            raise InvalidRPCReplyError(
+                str( [ call[ 0 ] for call in calls ] ), endpoint
+            ) from exception
+    with ThreadPoolExecutor( max_workers = 4 ) as executor:
+        futures = {
+            key: executor.submit( _call,
+                                  method,
+                                  endpoint,
+                                  timeout,
+                                  cast = cast )
+            for key, method, cast in _SNAPSHOT_CALLS
+        }
+        return {
+            key: future.result() for key, future in futures.items()
+        }
+
+
+class StatusPoller:
+    """Repeatedly snapshot node status without per-poll setup cost.
+
+    Holds one thread pool across polls, so repeating callers (metrics
+    exporters, explorer dashboards) reuse the same workers and pooled
+    connections each cycle. Use batch=False for endpoints that do not
+    support JSON-RPC batching. Usable as a context manager.
+
+    Example
+    -------
+    >>> with StatusPoller() as poller:
+    ...     status = poller.poll()
+
+    See also
+    --------
+    snapshot
+    """
+    def __init__(
+        self,
+        endpoint = DEFAULT_ENDPOINT,
+        timeout = DEFAULT_TIMEOUT,
+        batch = True,
+        max_workers = 4
+    ):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.batch = batch
+        self._executor = ThreadPoolExecutor( max_workers = max_workers )
+
+    def poll( self ) -> dict:
+        """Get a status snapshot, see snapshot for the structure."""
+        if self.batch:
+            return snapshot( endpoint = self.endpoint,
+                             timeout = self.timeout )
+        futures = {
+            key: self._executor.submit( _call,
+                                        method,
+                                        self.endpoint,
+                                        self.timeout,
+                                        cast = cast )
+            for key, method, cast in _SNAPSHOT_CALLS
+        }
+        return {
+            key: future.result() for key, future in futures.items()
+        }
+
+    def close( self ):
+        """Shut the thread pool down."""
+        self._executor.shutdown()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_val, exc_tb ):
+        self.close()
+
+
+async def aget_block_by_number( # pylint: disable=too-many-arguments
+    block_num,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+) -> dict:
+    """Async version of get_block_by_number, backed by httpx.
+
+    Parameters and return structure are identical to
+    get_block_by_number; requires the optional httpx dependency
+    (`pip install pyitc[async]`).
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    get_block_by_number
+    """
+    params = [
+        block_num,
+        _opts_dict(
+            BlockFetchOpts(
+                full_tx,
+                include_tx,
+                include_staking_tx,
+                include_signers
+            )
+        ),
+    ]
+    method = "itcv2_getBlockByNumber"
+    try:
+        reply = await arpc_request(
             method,
             params = params,
             endpoint = endpoint,
             timeout = timeout
-        )[ "result" ]
+        )
+        return reply[ "result" ]
     except KeyError as exception:
         raise InvalidRPCReplyError( method, endpoint ) from exception
 
 
+async def get_blocks_by_number_parallel( # pylint: disable=too-many-arguments
+    block_nums,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    concurrency=8,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+) -> list:
+    """Fetch the given blocks concurrently over the async transport.
+
+    Issues one itcv2_getBlockByNumber call per block with at most
+    concurrency requests in flight, so N independent fetches overlap
+    their round-trips instead of serializing them. Requires the
+    optional httpx dependency (`pip install pyitc[async]`).
+
+    Parameters
+    ----------
+    block_nums: :obj:`list` of :obj:`int`
+        Block numbers to fetch
+    concurrency: :obj:`int`, optional
+        Maximum number of requests in flight
+    For the remaining parameters, see get_block_by_number
+
+    Returns
+    -------
+    list of blocks in block_nums order, see get_block_by_number for
+    block structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    aget_block_by_number, get_blocks_by_number
+    """
+    semaphore = asyncio.Semaphore( concurrency )
+
+    async def fetch( block_num ):
+        async with semaphore:
+            return await aget_block_by_number(
+                block_num,
+                full_tx = full_tx,
+                include_tx = include_tx,
+                include_staking_tx = include_staking_tx,
+                include_signers = include_signers,
+                endpoint = endpoint,
+                timeout = timeout,
+            )
+
+    return list(
+        await asyncio.gather( *( fetch( num ) for num in block_nums ) )
+    )
+
+
+def get_blocks_by_number_parallel_sync( block_nums, **kwargs ) -> list:
+    """Run get_blocks_by_number_parallel from synchronous code.
+
+    See also
+    --------
+    get_blocks_by_number_parallel
+    """
+    return asyncio.run(
+        get_blocks_by_number_parallel( block_nums, **kwargs )
+    )
+
+
+def get_blocks_by_number( # pylint: disable=too-many-arguments
+    block_nums,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+    batch_size=20,
+) -> list:
+    """Get each of the blocks at the given block numbers.
+
+    Unlike get_blocks, the block numbers do not need to be contiguous;
+    all blocks are fetched in a single JSON-RPC batch request instead of
+    one round-trip per block.
+
+    Parameters
+    ----------
+    block_nums: :obj:`list` of :obj:`int`
+        Block numbers to fetch
+    full_tx: :obj:`bool`, optional
+        Include full transactions data for the blocks
+    include_tx: :obj:`bool`, optional
+        Include regular transactions for the blocks
+    include_staking_tx: :obj:`bool`, optional
+        Include staking transactions for the blocks
+    include_signers: :obj:`bool`, optional
+        Include list of signers for the blocks
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    list of blocks, see get_block_by_number for block structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    get_block_by_number
+    """
+    method = "itcv2_getBlockByNumber"
+    options = _opts_dict(
+        BlockFetchOpts(
+            full_tx,
+            include_tx,
+            include_staking_tx,
+            include_signers
+        )
+    )
+    calls = [
+        ( method, [ block_num, options ] ) for block_num in block_nums
+    ]
+    try:
+        return [
+            reply[ "result" ]
+            for reply in rpc_batch_request( calls,
+                                            endpoint = endpoint,
+                                            timeout = timeout,
+                                            max_batch = batch_size )
+        ]
+    except KeyError as exception:
+        raise InvalidRPCReplyError( method, endpoint ) from exception
+
+
+def get_block_by_hash( # pylint: disable=too-many-arguments
+    block_hash,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+) -> dict:
+    """Get block by hash.
+
+    Parameters
+    ----------
+    block_hash: :obj:`str`
+        Block hash to fetch
+    full_tx: :obj:`bool`, optional
+        Include full transactions data for the block
+    include_tx: :obj:`bool`, optional
+        Include regular transactions for the block
+    include_staking_tx: :obj:`bool`, optional
+        Include staking transactions for the block
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    See get_block_by_number for block structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    API Reference
+    -------------
+    https://api.intelchain.org/#6a49ec47-1f74-4732-9f04-e5d76160bd5c
+    """
+    opts = BlockFetchOpts(
+        full_tx,
+        include_tx,
+        include_staking_tx,
+        include_signers
+    )
+    return _fetch_block_by_hash( block_hash, opts, endpoint, timeout )
+
+
+@ttl_lru_cache( maxsize = 4096, ttl_seconds = 3600 )
+def _fetch_block_by_hash( block_hash, opts, endpoint, timeout ) -> dict:
+    """Cached body of get_block_by_hash.
+
+    A block reached by hash is immutable, so entries only leave the
+    cache through LRU eviction or clear_cache().
+    """
+    method = "itcv2_getBlockByHash"
+    params = [ block_hash, _opts_dict( opts ) ]
+    return _call( method, endpoint, timeout, params = params )
+
+
 def get_block_transaction_count_by_number(
     block_num,
     endpoint = DEFAULT_ENDPOINT,
@@ -1220,19 +1912,11 @@ def get_block_transaction_count_by_number(
     -------------
     https://api.intelchain.org/#26c5adfb-d757-4595-9eb7-c6efef63df32
     """
-    params = [ block_num ]
+    params = _INT_PARAMS % block_num if type(
+        block_num
+    ) is int else [ block_num ]
     method = "itcv2_getBlockTransactionCountByNumber"
-    try:
-        return int(
-            rpc_request(
-                method,
-                params = params,
-                endpoint = endpoint,
-                timeout = timeout
-            )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, params = params, cast = int )
 
 
 def get_block_transaction_count_by_hash(
@@ -1269,17 +1953,7 @@ def get_block_transaction_count_by_hash(
     """
     params = [ block_hash ]
     method = "itcv2_getBlockTransactionCountByHash"
-    try:
-        return int(
-            rpc_request(
-                method,
-                params = params,
-                endpoint = endpoint,
-                timeout = timeout
-            )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, params = params, cast = int )
 
 
 def get_block_staking_transaction_count_by_number(
@@ -1314,19 +1988,11 @@ def get_block_staking_transaction_count_by_number(
     -------------
     https://github.com/zennittians/intelchain/blob/1a8494c069dc3f708fdf690456713a2411465199/rpc/transaction.go#L494
     """
-    params = [ block_num ]
+    params = _INT_PARAMS % block_num if type(
+        block_num
+    ) is int else [ block_num ]
     method = "itcv2_getBlockStakingTransactionCountByNumber"
-    try:
-        return int(
-            rpc_request(
-                method,
-                params = params,
-                endpoint = endpoint,
-                timeout = timeout
-            )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, params = params, cast = int )
 
 
 def get_block_staking_transaction_count_by_hash(
@@ -1363,17 +2029,7 @@ def get_block_staking_transaction_count_by_hash(
     """
     params = [ block_hash ]
     method = "itcv2_getBlockStakingTransactionCountByHash"
-    try:
-        return int(
-            rpc_request(
-                method,
-                params = params,
-                endpoint = endpoint,
-                timeout = timeout
-            )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, params = params, cast = int )
 
 
 def get_blocks( # pylint: disable=too-many-arguments
@@ -1423,23 +2079,167 @@ def get_blocks( # pylint: disable=too-many-arguments
     params = [
         start_block,
         end_block,
-        {
-            "withSigners": include_signers,
-            "fullTx": full_tx,
-            "inclStaking": include_staking_tx,
-            "inclTx": include_tx,
-        },
+        _opts_dict(
+            BlockFetchOpts(
+                full_tx,
+                include_tx,
+                include_staking_tx,
+                include_signers
+            )
+        ),
     ]
     method = "itcv2_getBlocks"
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    if _lazy_loads is not None and os.environ.get( "PYITC_LAZY_JSON" ):
+        # lazy pysimdjson proxy: only the fields callers touch are
+        # materialized, a large win for full_tx responses; each call
+        # parses with its own parser, so the proxy stays valid for as
+        # long as the caller holds it
+        try:
+            raw = base_request( method,
+                                params = params,
+                                endpoint = endpoint,
+                                timeout = timeout )
+            return _lazy_loads( raw )[ "result" ]
+        except ( KeyError, TypeError, ValueError ) as exception:
+            raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, params = params )
+
+
+def get_blocks_iter( # pylint: disable=too-many-arguments
+    start_block,
+    end_block,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+):
+    """Yield blocks from a range one at a time.
+
+    With the optional ijson package installed the response body is
+    parsed incrementally while it streams in, keeping peak memory at
+    one block instead of the whole range — worth it for indexers
+    walking wide full_tx ranges; without it this falls back to
+    get_blocks and yields from the parsed reply.
+
+    Parameters
+    ----------
+    See get_blocks
+
+    Yields
+    ------
+    dict per block, see get_block_by_number for block structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    get_blocks, iter_cross_links
+    """
+    if ijson is None:
+        yield from get_blocks( start_block,
+                               end_block,
+                               full_tx = full_tx,
+                               include_tx = include_tx,
+                               include_staking_tx = include_staking_tx,
+                               include_signers = include_signers,
+                               endpoint = endpoint,
+                               timeout = timeout )
+        return
+    params = [
+        start_block,
+        end_block,
+        _opts_dict(
+            BlockFetchOpts(
+                full_tx,
+                include_tx,
+                include_staking_tx,
+                include_signers
+            )
+        ),
+    ]
+    method = "itcv2_getBlocks"
+    stream = base_request_stream( method,
+                                  params = params,
+                                  endpoint = endpoint,
+                                  timeout = timeout )
+    yield from _stream_result_items( stream, method, endpoint )
+
+
+def get_blocks_parallel( # pylint: disable=too-many-arguments
+    start_block,
+    end_block,
+    full_tx=False,
+    include_tx=False,
+    include_staking_tx=False,
+    include_signers=False,
+    workers=8,
+    chunk=32,
+    endpoint=DEFAULT_ENDPOINT,
+    timeout=DEFAULT_TIMEOUT,
+) -> list:
+    """Get a range of blocks, fetched as concurrent sub-ranges.
+
+    Splits [start_block, end_block] into chunks of at most chunk blocks
+    and issues a get_blocks call per chunk over a thread pool, so the
+    server works on sub-ranges concurrently and no single monolithic
+    call has to fit in one timeout. The pooled keep-alive sessions are
+    shared across the worker threads.
+
+    Parameters
+    ----------
+    start_block: :obj:`int`
+        First block to fetch (inclusive)
+    end_block: :obj:`int`
+        Last block to fetch (inclusive)
+    workers: :obj:`int`, optional
+        Number of concurrent get_blocks calls
+    chunk: :obj:`int`, optional
+        Maximum number of blocks per call
+    For the remaining parameters, see get_blocks
+
+    Returns
+    -------
+    list of blocks ordered by block number, see get_block_by_number
+    for block structure
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    get_blocks
+    """
+    ranges = [
+        ( sub_start, min( sub_start + chunk - 1, end_block ) )
+        for sub_start in range( start_block, end_block + 1, chunk )
+    ]
+    with ThreadPoolExecutor( max_workers = workers ) as executor:
+        futures = [
+            executor.submit(
+                get_blocks,
+                sub_start,
+                sub_end,
+                full_tx = full_tx,
+                include_tx = include_tx,
+                include_staking_tx = include_staking_tx,
+                include_signers = include_signers,
+                endpoint = endpoint,
+                timeout = timeout,
+            ) for sub_start,
+            sub_end in ranges
+        ]
+        blocks = [
+            block for future in futures for block in future.result()
+        ]
+    blocks.sort( key = lambda block: block[ "number" ] )
+    return blocks
 
 
 def get_block_signers(
@@ -1472,15 +2272,64 @@ def get_block_signers(
     -------------
     https://api.intelchain.org/#1e4b5f41-9db6-4dea-92fb-4408db78e622
     """
+    return _fetch_block_signers( block_num, endpoint, timeout )
+
+
+@ttl_lru_cache( maxsize = 1024, ttl_seconds = 2 )
+def _fetch_block_signers( block_num, endpoint, timeout ) -> list:
+    """Cached body of get_block_signers; the short TTL only shields
+    repeat queries near the tip, where the block may not be final."""
+    method = "itcv2_getBlockSigners"
     params = [ block_num ]
+    return _call( method, endpoint, timeout, params = params )
+
+
+def get_block_signers_batched(
+    block_nums,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    batch_size = 20
+) -> list:
+    """Get the signer lists for each of the given block numbers.
+
+    All signer lists are fetched in a single JSON-RPC batch request
+    instead of one round-trip per block.
+
+    Parameters
+    ----------
+    block_nums: :obj:`list` of :obj:`int`
+        Block numbers to get signers for
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    batch_size: :obj:`int`, optional
+        Maximum number of calls per HTTP request
+
+    Returns
+    -------
+    list of signer lists, one per block in block_nums order; see
+    get_block_signers
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    get_block_signers
+    """
     method = "itcv2_getBlockSigners"
+    calls = [ ( method, [ block_num ] ) for block_num in block_nums ]
     try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
+        return [
+            reply[ "result" ]
+            for reply in rpc_batch_request( calls,
+                                            endpoint = endpoint,
+                                            timeout = timeout,
+                                            max_batch = batch_size )
+        ]
     except KeyError as exception:
         raise InvalidRPCReplyError( method, endpoint ) from exception
 
@@ -1515,17 +2364,15 @@ def get_block_signers_keys(
     -------------
     https://api.intelchain.org/#9f9c8298-1a4e-4901-beac-f34b59ed02f1
     """
-    params = [ block_num ]
+    return _fetch_block_signer_keys( block_num, endpoint, timeout )
+
+
+@ttl_lru_cache( maxsize = 1024, ttl_seconds = 2 )
+def _fetch_block_signer_keys( block_num, endpoint, timeout ) -> list:
+    """Cached body of get_block_signers_keys."""
     method = "itcv2_getBlockSignerKeys"
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    params = [ block_num ]
+    return _call( method, endpoint, timeout, params = params )
 
 
 def is_block_signer(
@@ -1561,17 +2408,66 @@ def is_block_signer(
     -------------
     https://github.com/zennittians/intelchain/blob/1a8494c069dc3f708fdf690456713a2411465199/rpc/blockchain.go#L368
     """
-    params = [ block_num, address ]
-    method = "itcv2_isBlockSigner"
+    address = _norm_addr( address )
     try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+        return address in _signer_set( block_num, endpoint, timeout )
+    except ( InvalidRPCReplyError, RPCError, RequestsError ):
+        # node may not serve the signer list (an RPC error object) or
+        # the fetch may have failed outright; ask it directly
+        params = [ block_num, address ]
+        method = "itcv2_isBlockSigner"
+        return _call( method, endpoint, timeout, params = params )
+
+
+@ttl_lru_cache( maxsize = 1024, ttl_seconds = 2 )
+def _signer_set( block_num, endpoint, timeout ) -> frozenset:
+    """Signer list for block_num as a frozenset for O(1) membership."""
+    signers = _fetch_block_signers( block_num, endpoint, timeout )
+    if not isinstance( signers, list ):
+        raise InvalidRPCReplyError( "itcv2_getBlockSigners", endpoint )
+    return frozenset( _norm_addr( signer ) for signer in signers )
+
+
+def are_block_signers(
+    block_num,
+    addresses,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+) -> dict:
+    """Check several addresses against the signers of one block.
+
+    The signer list is fetched once (at most one round-trip, served
+    from cache on repeats) and every membership test is answered
+    client-side, instead of one isBlockSigner call per address.
+
+    Parameters
+    ----------
+    block_num: :obj:`int`
+        Block number to check
+    addresses: :obj:`list` of :obj:`str`
+        Addresses to check
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    dict mapping each address to True if it signed block_num
+
+    Raises
+    ------
+    InvalidRPCReplyError
+        If received unknown result from endpoint
+
+    See also
+    --------
+    is_block_signer, get_block_signers
+    """
+    signers = _signer_set( block_num, endpoint, timeout )
+    return {
+        address: _norm_addr( address ) in signers for address in addresses
+    }
 
 
 def get_signed_blocks(
@@ -1604,19 +2500,9 @@ def get_signed_blocks(
     -------------
     https://github.com/zennittians/intelchain/blob/1a8494c069dc3f708fdf690456713a2411465199/rpc/blockchain.go#L406
     """
-    params = [ address ]
+    params = [ _norm_addr( address ) ]
     method = "itcv2_getSignedBlocks"
-    try:
-        return int(
-            rpc_request(
-                method,
-                params = params,
-                endpoint = endpoint,
-                timeout = timeout
-            )[ "result" ]
-        )
-    except ( KeyError, TypeError ) as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    return _call( method, endpoint, timeout, params = params, cast = int )
 
 
 def get_validators(
@@ -1652,17 +2538,15 @@ def get_validators(
     -------------
     https://api.intelchain.org/#4dfe91ad-71fa-4c7d-83f3-d1c86a804da5
     """
-    params = [ epoch ]
+    return _fetch_validators( epoch, endpoint, timeout )
+
+
+@ttl_lru_cache( maxsize = 256, ttl_seconds = 2 )
+def _fetch_validators( epoch, endpoint, timeout ) -> dict:
+    """Cached body of get_validators."""
     method = "itcv2_getValidators"
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    params = [ epoch ]
+    return _call( method, endpoint, timeout, params = params )
 
 
 def get_validator_keys(
@@ -1695,14 +2579,12 @@ def get_validator_keys(
     -------------
     https://api.intelchain.org/#1439b580-fa3c-4d44-a79d-303390997a8c
     """
-    params = [ epoch ]
+    return _fetch_validator_keys( epoch, endpoint, timeout )
+
+
+@ttl_lru_cache( maxsize = 256, ttl_seconds = 2 )
+def _fetch_validator_keys( epoch, endpoint, timeout ) -> list:
+    """Cached body of get_validator_keys."""
     method = "itcv2_getValidatorKeys"
-    try:
-        return rpc_request(
-            method,
-            params = params,
-            endpoint = endpoint,
-            timeout = timeout
-        )[ "result" ]
-    except KeyError as exception:
-        raise InvalidRPCReplyError( method, endpoint ) from exception
+    params = [ epoch ]
+    return _call( method, endpoint, timeout, params = params )
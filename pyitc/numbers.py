@@ -5,7 +5,35 @@ For more granular conversions, see Web3.toWei
 
 from decimal import Decimal
 
-_conversion_unit = Decimal( 1e18 )
+_CONVERSION_UNIT = Decimal( "1000000000000000000" )
+_CONVERSION_UNIT_INT = 10 ** 18
+_INV_CONVERSION_UNIT = Decimal( 1 ).scaleb( -18 )
+
+
+def _generic_to_itc( intelli ) -> Decimal:
+    return Decimal( intelli ) * _INV_CONVERSION_UNIT
+
+
+# type -> handler tables: one dict probe instead of an isinstance
+# chain, and subclass inputs fall through to the generic handler
+_TO_ITC = {
+    int: _generic_to_itc,
+    Decimal: lambda intelli: intelli * _INV_CONVERSION_UNIT,
+    float: lambda intelli: Decimal( int( intelli ) ) * _INV_CONVERSION_UNIT,
+    str: _generic_to_itc,
+}
+
+
+def _generic_to_intelli( one ) -> Decimal:
+    return Decimal( one ) * _CONVERSION_UNIT
+
+
+_TO_INTELLI = {
+    int: lambda one: Decimal( one * _CONVERSION_UNIT_INT ),
+    Decimal: lambda one: one * _CONVERSION_UNIT,
+    float: lambda one: Decimal( str( one ) ) * _CONVERSION_UNIT,
+    str: _generic_to_intelli,
+}
 
 
 def convert_intelli_to_itc( intelli ) -> Decimal:
@@ -22,9 +50,8 @@ def convert_intelli_to_itc( intelli ) -> Decimal:
     decimal
         Converted value in ONE
     """
-    if isinstance( INTELLI, float ):
-        INTELLI = int( INTELLI )
-    return Decimal( INTELLI ) / _conversion_unit
+    handler = _TO_ITC.get( type( intelli ), _generic_to_itc )
+    return handler( intelli )
 
 
 def convert_itc_to_intelli( one ) -> Decimal:
@@ -40,6 +67,5 @@ def convert_itc_to_intelli( one ) -> Decimal:
     decimal
         Converted value in INTELLI
     """
-    if isinstance( one, float ):
-        one = str( one )
-    return Decimal( one ) * _conversion_unit
+    handler = _TO_INTELLI.get( type( one ), _generic_to_intelli )
+    return handler( one )
@@ -0,0 +1 @@
+from .request import set_transport, close_sessions
@@ -0,0 +1,187 @@
+"""
+Async RPC wrapper around the optional httpx library
+Install with `pip install pyitc[async]` to use it
+"""
+import asyncio
+
+try:
+    import httpx
+except ImportError:  # optional dependency, checked at call time
+    httpx = None
+
+from .exceptions import RequestsError, RequestsTimeoutError, RPCError
+
+from .._serialization import loads as _json_loads, dumps as _json_dumps
+
+from ..constants import DEFAULT_ENDPOINT, DEFAULT_TIMEOUT
+
+_clients = {}
+
+
+def _get_client():
+    """Get (or create) the shared async HTTP client for this loop.
+
+    The client keeps connections alive across calls and multiplexes
+    over HTTP/2 when the h2 package is installed. Clients are cached
+    per running event loop: pooled connections are bound to the loop
+    they were opened on, so reusing one client across asyncio.run
+    calls would fail with "Event loop is closed" on the second run.
+
+    Raises
+    ------
+    ImportError
+        If httpx is not installed
+    """
+    if httpx is None:
+        raise ImportError(
+            "httpx is required for async RPC requests, "
+            "install it with `pip install pyitc[async]`"
+        )
+    loop = asyncio.get_running_loop()
+    client = _clients.get( loop )
+    if client is None or client.is_closed:
+        # drop clients stranded on loops that have since closed; their
+        # connections died with the loop
+        for stale in [ l for l in _clients if l.is_closed() ]:
+            del _clients[ stale ]
+        limits = httpx.Limits(
+            max_keepalive_connections = 16,
+            max_connections = 32
+        )
+        try:
+            client = httpx.AsyncClient( http2 = True, limits = limits )
+        except ImportError:  # h2 not installed, fall back to HTTP/1.1
+            client = httpx.AsyncClient( limits = limits )
+        _clients[ loop ] = client
+    return client
+
+
+async def aclose_client():
+    """Close this loop's async HTTP client, if one was created."""
+    client = _clients.pop( asyncio.get_running_loop(), None )
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def abase_request(
+    method,
+    params = None,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+) -> str:
+    """Async equivalent of base_request.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    str
+        Raw output from the request
+
+    Raises
+    ------
+    TypeError
+        If params is not a list or None
+    RequestsTimeoutError
+        If request timed out
+    RequestsError
+        If other request error occured
+
+    See Also
+    --------
+    base_request
+    """
+    if params is None:
+        params = []
+    elif not isinstance( params, list ):
+        raise TypeError( f"invalid type {params.__class__}" )
+
+    payload = {
+        "id": "1",
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params
+    }
+    headers = {
+        "Content-Type": "application/json"
+    }
+
+    # One timer against the whole request instead of httpx setting up
+    # its own timeout context per call: a single call_at insertion,
+    # cancelled on the happy path before it ever fires.
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(
+        _get_client().post(
+            endpoint,
+            headers = headers,
+            content = _json_dumps( payload ),
+            timeout = None,
+        )
+    )
+    handle = loop.call_at( loop.time() + timeout, task.cancel )
+    try:
+        resp = await task
+        return resp.content
+    except asyncio.CancelledError as err:
+        if handle.when() <= loop.time():  # our timer fired
+            raise RequestsTimeoutError( endpoint ) from err
+        raise
+    except httpx.TimeoutException as err:
+        raise RequestsTimeoutError( endpoint ) from err
+    except httpx.HTTPError as err:
+        raise RequestsError( endpoint ) from err
+    finally:
+        handle.cancel()
+
+
+async def arpc_request(
+    method,
+    params = None,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+) -> dict:
+    """Async equivalent of rpc_request.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    dict
+        Returns dictionary representation of RPC response
+
+    Raises
+    ------
+    RPCError
+        If RPC response returned a blockchain error
+
+    See Also
+    --------
+    rpc_request, abase_request
+    """
+    raw_resp = await abase_request( method, params, endpoint, timeout )
+
+    try:
+        resp = _json_loads( raw_resp )
+        if "error" in resp:
+            raise RPCError( method, endpoint, str( resp[ "error" ] ) )
+        return resp
+    except ValueError as err:
+        raise RPCError( method, endpoint, raw_resp ) from err
@@ -1,14 +1,333 @@
 """
 RPC wrapper around requests library
 """
+import gzip
 import json
+import os
+import socket
+import threading
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:  # optional, needed for the HTTP/2 transport only
+    httpx = None
+
+try:  # advertise brotli only when urllib3 can actually decode it
+    import brotli  # pylint: disable=unused-import
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
 
 from .exceptions import RequestsError, RequestsTimeoutError, RPCError
 
+from .._serialization import loads as _json_loads, dumps as _json_dumps
+
 from ..constants import DEFAULT_ENDPOINT, DEFAULT_TIMEOUT
 
+_session_pool = {}
+_http2_pool = {}
+_pool_lock = threading.Lock()
+
+_transport = "http2" if os.environ.get( "PYITC_HTTP2" ) else "http1"
+
+_payload_prefixes = {}
+_payload_templates = {}
+_batch_segments = {}
+
+# request bodies at least this large are gzip-compressed before sending
+_GZIP_THRESHOLD = 1024
+
+# sentinel distinguishing an absent result field from a null result
+_MISSING = object()
+
+
+def _encode_payload( method, params ) -> bytes:
+    """Encode the JSON-RPC envelope for method, reusing cached bytes.
+
+    The envelope around a call is constant per method, so the encoded
+    prefix (and, for the common zero-param calls, the entire payload)
+    is built once and reused; only the params are serialized per call.
+    Callers may pass params already encoded as JSON bytes, which are
+    spliced in without another serialization pass.
+    """
+    if isinstance( params, bytes ):
+        prefix = _payload_prefixes.get( method )
+        if prefix is None:
+            prefix = _payload_prefixes.setdefault(
+                method,
+                _encode_prefix( method )
+            )
+        return prefix + params + b'}'
+    if not params:
+        payload = _payload_templates.get( method )
+        if payload is None:
+            payload = _payload_templates.setdefault(
+                method,
+                _encode_prefix( method ) + b'[]}'
+            )
+        return payload
+    prefix = _payload_prefixes.get( method )
+    if prefix is None:
+        prefix = _payload_prefixes.setdefault(
+            method,
+            _encode_prefix( method )
+        )
+    return prefix + _json_dumps( params ) + b'}'
+
+
+def _encode_prefix( method ) -> bytes:
+    """Encode the constant envelope bytes up to the params value."""
+    return (
+        '{"id": "1", "jsonrpc": "2.0", "method": ' +
+        json.dumps( method ) + ', "params": '
+    ).encode()
+
+
+def _encode_batch_payload( calls ) -> bytes:
+    """Encode a JSON-RPC batch array, reusing cached envelope bytes.
+
+    Like _encode_payload, but for lists of (method, params) tuples:
+    the per-method envelope segment between the id and the params is
+    built once and reused, so only the ids and params are serialized
+    per call.
+    """
+    parts = []
+    for index, ( method, params ) in enumerate( calls ):
+        segment = _batch_segments.get( method )
+        if segment is None:
+            segment = _batch_segments.setdefault(
+                method,
+                (
+                    '", "jsonrpc": "2.0", "method": ' +
+                    json.dumps( method ) + ', "params": '
+                ).encode()
+            )
+        parts.append(
+            b'{"id": "' + str( index ).encode() + segment +
+            ( _json_dumps( params ) if params else b'[]' ) + b'}'
+        )
+    return b'[' + b', '.join( parts ) + b']'
+
+
+def _to_int( value ) -> int:
+    """Convert an RPC result to int, whatever form the node returned.
+
+    v2 methods reply with plain ints, while the eth-style methods
+    (net_peerCount, net_version) reply with 0x-prefixed hex strings;
+    base 0 parsing accepts both string forms without branching on the
+    prefix, and ints pass through untouched.
+    """
+    if isinstance( value, int ):
+        return value
+    if isinstance( value, str ):
+        return int( value, 0 )
+    return int( value )
+
+
+def _to_bool( value ) -> bool:
+    """Validate and convert a boolean RPC result.
+
+    bool() itself never fails on JSON-decoded values, so a missing or
+    null result would silently read as False; reject anything that is
+    not a JSON boolean or number before converting.
+    """
+    if not isinstance( value, ( bool, int ) ):
+        raise TypeError( f"invalid type {value.__class__}" )
+    return bool( value )
+
+
+def _install_dns_cache( ttl_seconds = 60 ):
+    """Cache DNS lookups, opt-in via the PYITC_DNS_CACHE env var.
+
+    urllib3 resolves the endpoint host every time it opens a
+    connection; when a burst exhausts the keep-alive pool, each new
+    connection pays a blocking DNS query. Wrap socket.getaddrinfo with
+    a small TTL cache so repeat lookups within the TTL are served from
+    memory. Installing twice is a no-op.
+    """
+    if getattr( socket.getaddrinfo, "_pyitc_dns_cache", False ):
+        return
+    resolve = socket.getaddrinfo
+    cache = {}
+    lock = threading.Lock()
+
+    def _cached_getaddrinfo( *args, **kwargs ):
+        key = ( args, tuple( sorted( kwargs.items() ) ) )
+        now = time.monotonic()
+        with lock:
+            entry = cache.get( key )
+            if entry is not None and now < entry[ 1 ]:
+                return entry[ 0 ]
+        value = resolve( *args, **kwargs )
+        with lock:
+            cache[ key ] = ( value, now + ttl_seconds )
+            while len( cache ) > 256:
+                cache.pop( next( iter( cache ) ) )
+        return value
+
+    _cached_getaddrinfo._pyitc_dns_cache = True
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+if os.environ.get( "PYITC_DNS_CACHE" ):
+    _install_dns_cache()
+
+
+def _build_session() -> requests.Session:
+    """Build a session with keep-alive & a tuned connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections = 16,
+        pool_maxsize = 64,
+        pool_block = False,
+        max_retries = 0
+    )
+    session.mount( "http://", adapter )
+    session.mount( "https://", adapter )
+    session.headers.update(
+        {
+            "Connection": "keep-alive",
+            "Content-Type": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING
+        }
+    )
+    return session
+
+
+def _get_session( endpoint ) -> requests.Session:
+    """Get (or create) the keep-alive session for endpoint.
+
+    Sessions are shared across threads (requests allows this); the
+    lock only guards creation, so concurrent first calls from a thread
+    pool do not each build and leak their own session.
+    """
+    session = _session_pool.get( endpoint )
+    if session is None:
+        with _pool_lock:
+            session = _session_pool.get( endpoint )
+            if session is None:
+                session = _build_session()
+                _session_pool[ endpoint ] = session
+    return session
+
+
+def close_sessions():
+    """Close all pooled sessions, dropping any kept-alive connections."""
+    while _session_pool:
+        _, session = _session_pool.popitem()
+        session.close()
+    while _http2_pool:
+        _, client = _http2_pool.popitem()
+        client.close()
+
+
+def set_transport( transport ):
+    """Select the HTTP transport used for RPC requests.
+
+    The default "http1" transport uses requests with keep-alive.
+    "http2" (also selected by setting the PYITC_HTTP2 environment
+    variable) sends all requests through an httpx client that
+    multiplexes concurrent calls over one HTTP/2 connection, removing
+    the per-connection in-flight limit of HTTP/1.1; the endpoint (or a
+    front-proxy such as nginx/haproxy) must speak HTTP/2. Without the
+    h2 package the httpx client silently negotiates HTTP/1.1 instead.
+
+    Parameters
+    ----------
+    transport: :obj:`str`
+        Either "http1" or "http2"
+
+    Raises
+    ------
+    ValueError
+        If transport is not a known transport name
+    ImportError
+        If "http2" is requested but httpx is not installed
+    """
+    global _transport  # pylint: disable=global-statement
+    if transport not in ( "http1", "http2" ):
+        raise ValueError( f"unknown transport {transport}" )
+    if transport == "http2" and httpx is None:
+        raise ImportError(
+            "httpx is required for the HTTP/2 transport, "
+            "install it with `pip install pyitc[async]`"
+        )
+    _transport = transport
+
+
+def _get_http2_client( endpoint ):
+    """Get (or create) the HTTP/2 client for endpoint."""
+    client = _http2_pool.get( endpoint )
+    if client is None:
+        with _pool_lock:
+            client = _http2_pool.get( endpoint )
+            if client is None:
+                limits = httpx.Limits(
+                    max_keepalive_connections = 16,
+                    max_connections = 32
+                )
+                headers = {
+                    "Content-Type": "application/json"
+                }
+                try:
+                    client = httpx.Client(
+                        http2 = True,
+                        limits = limits,
+                        headers = headers
+                    )
+                except ImportError:  # h2 not installed, fall back to HTTP/1.1
+                    client = httpx.Client(
+                        limits = limits,
+                        headers = headers
+                    )
+                _http2_pool[ endpoint ] = client
+    return client
+
+
+def _post( endpoint, payload, timeout, compress = False ) -> bytes:
+    """POST the encoded payload over the selected transport.
+
+    With compress, bodies at or above _GZIP_THRESHOLD are gzipped
+    before sending; tiny payloads are left alone since the compression
+    overhead dominates there.
+    """
+    headers = None
+    if compress and len( payload ) >= _GZIP_THRESHOLD:
+        if isinstance( payload, str ):
+            payload = payload.encode()
+        payload = gzip.compress( payload )
+        headers = {
+            "Content-Encoding": "gzip"
+        }
+    if _transport == "http2" and httpx is not None:
+        try:
+            return _get_http2_client( endpoint ).post(
+                endpoint,
+                content = payload,
+                headers = headers,
+                timeout = timeout,
+            ).content
+        except httpx.TimeoutException as err:
+            raise RequestsTimeoutError( endpoint ) from err
+        except httpx.HTTPError as err:
+            raise RequestsError( endpoint ) from err
+    try:
+        return _get_session( endpoint ).post(
+            endpoint,
+            data = payload,
+            headers = headers,
+            timeout = timeout,
+            allow_redirects = True,
+        ).content
+    except requests.exceptions.Timeout as err:
+        raise RequestsTimeoutError( endpoint ) from err
+    except requests.exceptions.RequestException as err:
+        raise RequestsError( endpoint ) from err
+
 
 def base_request(
     method,
@@ -22,8 +341,9 @@ def base_request(
     ---------
     method: str
         RPC Method to call
-    params: :obj:`list`, optional
-        Parameters for the RPC method
+    params: :obj:`list` or :obj:`bytes`, optional
+        Parameters for the RPC method, either as a list or already
+        encoded as a JSON array in bytes
     endpoint: :obj:`str`, optional
         Endpoint to send request to
     timeout: :obj:`int`, optional
@@ -34,6 +354,50 @@ def base_request(
     str
         Raw output from the request
 
+    Raises
+    ------
+    TypeError
+        If params is not a list, bytes or None
+    RequestsTimeoutError
+        If request timed out
+    RequestsError
+        If other request error occured
+    """
+    if params is None:
+        params = []
+    elif not isinstance( params, ( list, bytes ) ):
+        raise TypeError( f"invalid type {params.__class__}" )
+
+    return _post( endpoint, _encode_payload( method, params ), timeout )
+
+
+def base_request_stream(
+    method,
+    params = None,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+):
+    """Basic RPC request, returning the response body as a stream.
+
+    Unlike base_request, the body is not read into memory; the caller
+    gets a file-like object suitable for incremental JSON parsing of
+    very large replies. Only available on the http1 transport.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    File-like object over the (decoded) response body
+
     Raises
     ------
     TypeError
@@ -42,32 +406,26 @@ def base_request(
         If request timed out
     RequestsError
         If other request error occured
+
+    See Also
+    --------
+    base_request
     """
     if params is None:
         params = []
-    elif not isinstance( params, list ):
+    elif not isinstance( params, ( list, bytes ) ):
         raise TypeError( f"invalid type {params.__class__}" )
 
     try:
-        payload = {
-            "id": "1",
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params
-        }
-        headers = {
-            "Content-Type": "application/json"
-        }
-
-        resp = requests.request(
-            "POST",
+        resp = _get_session( endpoint ).post(
             endpoint,
-            headers = headers,
-            data = json.dumps( payload ),
+            data = _encode_payload( method, params ),
             timeout = timeout,
             allow_redirects = True,
+            stream = True,
         )
-        return resp.content
+        resp.raw.decode_content = True
+        return resp.raw
     except requests.exceptions.Timeout as err:
         raise RequestsTimeoutError( endpoint ) from err
     except requests.exceptions.RequestException as err:
@@ -116,9 +474,198 @@ def rpc_request(
     raw_resp = base_request( method, params, endpoint, timeout )
 
     try:
-        resp = json.loads( raw_resp )
+        resp = _json_loads( raw_resp )
         if "error" in resp:
             raise RPCError( method, endpoint, str( resp[ "error" ] ) )
         return resp
-    except json.decoder.JSONDecodeError as err:
+    except ValueError as err:
         raise RPCError( method, endpoint, raw_resp ) from err
+
+
+def rpc_result(
+    method,
+    params = None,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+):
+    """RPC request returning the result field directly.
+
+    Valid replies always carry either result or error; error is raised
+    here and result returned, so callers do not re-check the envelope
+    on every call. Use rpc_request when the envelope metadata itself is
+    needed.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    The result field of the RPC response
+
+    Raises
+    ------
+    RPCError
+        If RPC response returned a blockchain error
+    KeyError
+        If the RPC response carries no result field
+
+    See Also
+    --------
+    rpc_request
+    """
+    raw_resp = base_request( method, params, endpoint, timeout )
+
+    try:
+        resp = _json_loads( raw_resp )
+    except ValueError as err:
+        raise RPCError( method, endpoint, raw_resp ) from err
+    result = resp.get( "result", _MISSING )
+    if result is not _MISSING:
+        return result
+    if "error" in resp:
+        raise RPCError( method, endpoint, str( resp[ "error" ] ) )
+    raise KeyError( "result" )
+
+
+def _call0(
+    method,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+):
+    """Specialized rpc_result for zero-parameter methods.
+
+    Most of the blockchain getters take no RPC parameters; this path
+    posts the fully cached payload bytes for the method directly,
+    skipping params normalization and envelope assembly entirely.
+
+    See Also
+    --------
+    rpc_result
+    """
+    payload = _payload_templates.get( method )
+    if payload is None:
+        payload = _payload_templates.setdefault(
+            method,
+            _encode_prefix( method ) + b'[]}'
+        )
+    raw_resp = _post( endpoint, payload, timeout )
+
+    try:
+        resp = _json_loads( raw_resp )
+    except ValueError as err:
+        raise RPCError( method, endpoint, raw_resp ) from err
+    result = resp.get( "result", _MISSING )
+    if result is not _MISSING:
+        return result
+    if "error" in resp:
+        raise RPCError( method, endpoint, str( resp[ "error" ] ) )
+    raise KeyError( "result" )
+
+
+def base_batch_request(
+    calls,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT
+) -> str:
+    """Basic JSON-RPC 2.0 batch request.
+
+    Parameters
+    ---------
+    calls: :obj:`list` of (method, params) tuples
+        RPC methods with their parameters, sent as one batch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    str
+        Raw output from the request
+
+    Raises
+    ------
+    TypeError
+        If calls is not a list
+    RequestsTimeoutError
+        If request timed out
+    RequestsError
+        If other request error occured
+    """
+    if not isinstance( calls, list ):
+        raise TypeError( f"invalid type {calls.__class__}" )
+
+    payload = _encode_batch_payload( calls )
+
+    return _post( endpoint, payload, timeout, compress = True )
+
+
+def rpc_batch_request(
+    calls,
+    endpoint = DEFAULT_ENDPOINT,
+    timeout = DEFAULT_TIMEOUT,
+    max_batch = 20
+) -> list:
+    """JSON-RPC 2.0 batch request.
+
+    Sends the given calls as one (or a few) HTTP POSTs instead of one
+    round-trip per call, per the JSON-RPC batch spec. Calls are chunked
+    into sub-batches of at most max_batch entries to respect provider
+    batch caps.
+
+    Parameters
+    ---------
+    calls: :obj:`list` of (method, params) tuples
+        RPC methods with their parameters, sent as one batch
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    max_batch: :obj:`int`, optional
+        Maximum number of calls per HTTP request
+
+    Returns
+    -------
+    list
+        Dictionary representations of each RPC response, in call order
+
+    Raises
+    ------
+    RPCError
+        If any RPC response returned a blockchain error
+
+    See Also
+    --------
+    base_batch_request, rpc_request
+    """
+    results = []
+    for start in range( 0, len( calls ), max_batch ):
+        chunk = calls[ start : start + max_batch ]
+        raw_resp = base_batch_request( chunk, endpoint, timeout )
+
+        try:
+            resp = _json_loads( raw_resp )
+        except ValueError as err:
+            raise RPCError( str( [ call[ 0 ] for call in chunk ] ),
+                            endpoint,
+                            raw_resp ) from err
+        if isinstance( resp, dict ):  # batch-wide error reply
+            raise RPCError( str( [ call[ 0 ] for call in chunk ] ),
+                            endpoint,
+                            str( resp.get( "error", resp ) ) )
+        resp.sort( key = lambda reply: int( reply.get( "id", -1 ) ) )
+        for reply, call in zip( resp, chunk ):
+            if "error" in reply:
+                raise RPCError( call[ 0 ],
+                                endpoint,
+                                str( reply[ "error" ] ) )
+        results.extend( resp )
+    return results
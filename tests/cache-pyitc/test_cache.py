@@ -0,0 +1,104 @@
+import threading
+import time
+
+from pyitc._cache import ttl_lru_cache
+
+
+def test_hit_and_ttl_expiry():
+    calls = []
+
+    @ttl_lru_cache( maxsize = 8, ttl_seconds = 0.1 )
+    def fetch( key ):
+        calls.append( key )
+        return key.upper()
+
+    assert fetch( "a" ) == "A"
+    assert fetch( "a" ) == "A"
+    assert calls == [ "a" ]
+    time.sleep( 0.15 )
+    assert fetch( "a" ) == "A"
+    assert calls == [ "a", "a" ]
+
+
+def test_lru_eviction():
+    calls = []
+
+    @ttl_lru_cache( maxsize = 2, ttl_seconds = 60 )
+    def fetch( key ):
+        calls.append( key )
+        return key
+
+    fetch( "a" )
+    fetch( "b" )
+    fetch( "a" )  # refresh "a", making "b" least recently used
+    fetch( "c" )  # evicts "b"
+    fetch( "a" )
+    fetch( "b" )
+    assert calls == [ "a", "b", "c", "b" ]
+
+
+def test_invalidate():
+    calls = []
+
+    @ttl_lru_cache( maxsize = 8, ttl_seconds = 60 )
+    def fetch( key ):
+        calls.append( key )
+        return key
+
+    fetch( "a" )
+    fetch.invalidate()
+    fetch( "a" )
+    assert calls == [ "a", "a" ]
+
+
+def test_kwargs_part_of_key():
+    calls = []
+
+    @ttl_lru_cache( maxsize = 8, ttl_seconds = 60 )
+    def fetch( key, endpoint = "x" ):
+        calls.append( ( key, endpoint ) )
+        return endpoint
+
+    assert fetch( "a", endpoint = "one" ) == "one"
+    assert fetch( "a", endpoint = "two" ) == "two"
+    assert fetch( "a", endpoint = "one" ) == "one"
+    assert calls == [ ( "a", "one" ), ( "a", "two" ) ]
+
+
+def test_same_key_misses_coalesce():
+    calls = []
+
+    @ttl_lru_cache( maxsize = 8, ttl_seconds = 60 )
+    def fetch( key ):
+        calls.append( key )
+        time.sleep( 0.1 )
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread( target = lambda: results.append( fetch( "k" ) ) )
+        for _ in range( 4 )
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [ 42 ] * 4
+    assert calls == [ "k" ]
+
+
+def test_slow_key_does_not_block_other_keys():
+    @ttl_lru_cache( maxsize = 8, ttl_seconds = 60 )
+    def fetch( key ):
+        if key == "slow":
+            time.sleep( 0.5 )
+        return key
+
+    slow = threading.Thread( target = fetch, args = ( "slow", ) )
+    slow.start()
+    time.sleep( 0.05 )
+    start = time.monotonic()
+    assert fetch( "fast" ) == "fast"
+    elapsed = time.monotonic() - start
+    slow.join()
+    assert elapsed < 0.3
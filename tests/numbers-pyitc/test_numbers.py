@@ -29,3 +29,38 @@ def test_convert_itc_to_intelli():
 
     d = numbers.convert_itc_to_intelli( Decimal( 1 ) )
     assert Decimal( 1e18 ) == d
+
+
+def test_convert_intelli_to_itc_dispatch():
+    # int, Decimal, float and str all route through the type table
+    assert Decimal( 1 ) == numbers.convert_intelli_to_itc( 10 ** 18 )
+    assert Decimal( 1 ) == numbers.convert_intelli_to_itc(
+        Decimal( 10 ) ** 18
+    )
+    # floats are truncated: INTELLI is the smallest denomination
+    assert Decimal( 0 ) == numbers.convert_intelli_to_itc( 0.9 )
+    assert Decimal( "1e-18" ) == numbers.convert_intelli_to_itc( 1 )
+
+    class OddInt( int ):
+        pass
+
+    # subclasses fall through to the generic Decimal handler
+    assert Decimal( 2 ) == numbers.convert_intelli_to_itc(
+        OddInt( 2 * 10 ** 18 )
+    )
+
+
+def test_convert_itc_to_intelli_dispatch():
+    assert Decimal( 10 ** 18 ) == numbers.convert_itc_to_intelli( 1 )
+    assert Decimal( 3 * 10 ** 18 ) == numbers.convert_itc_to_intelli(
+        Decimal( 3 )
+    )
+    # float goes through str() so the written precision is preserved
+    assert Decimal( "1.1e18" ) == numbers.convert_itc_to_intelli( 1.1 )
+
+    class OddInt( int ):
+        pass
+
+    assert Decimal( 2 * 10 ** 18 ) == numbers.convert_itc_to_intelli(
+        OddInt( 2 )
+    )
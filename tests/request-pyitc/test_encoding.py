@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from pyitc.rpc import exceptions, request
+
+
+def test_encode_payload_zero_params():
+    payload = request._encode_payload( "itcv2_getNodeMetadata", [] )
+    assert json.loads( payload ) == {
+        "id": "1",
+        "jsonrpc": "2.0",
+        "method": "itcv2_getNodeMetadata",
+        "params": []
+    }
+    # the zero-param payload is cached and reused as-is
+    assert request._encode_payload( "itcv2_getNodeMetadata", [] ) is payload
+
+
+def test_encode_payload_with_params():
+    params = [ 42, { "fullTx": False, "inclTx": True }, "itc1abc", None ]
+    payload = request._encode_payload( "itcv2_getBlockByNumber", params )
+    assert json.loads( payload ) == {
+        "id": "1",
+        "jsonrpc": "2.0",
+        "method": "itcv2_getBlockByNumber",
+        "params": params
+    }
+
+
+def test_encode_payload_odd_method_names():
+    # method names needing JSON escaping must survive the splicing
+    for method in ( 'quo"te', "back\\slash", "unicode-é" ):
+        payload = request._encode_payload( method, [ 1 ] )
+        assert json.loads( payload )[ "method" ] == method
+
+
+def test_encode_payload_bytes_params():
+    payload = request._encode_payload( "itcv2_getHeaderByNumber", b"[7]" )
+    assert json.loads( payload )[ "params" ] == [ 7 ]
+
+
+def test_encode_batch_payload():
+    calls = [
+        ( "itcv2_blockNumber", [] ),
+        ( "itcv2_getEpoch", None ),
+        ( "itcv2_getBlockSigners", [ 7 ] ),
+        ( 'quo"te', [ "x" ] ),
+    ]
+    payload = request._encode_batch_payload( calls )
+    assert json.loads( payload ) == [
+        {
+            "id": str( index ),
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params if params is not None else []
+        } for index,
+        ( method, params ) in enumerate( calls )
+    ]
+    # cached per-method segments must not corrupt a second encode
+    assert json.loads( request._encode_batch_payload( calls ) ) == json.loads(
+        payload
+    )
+
+
+def test_to_int():
+    assert request._to_int( 7 ) == 7
+    assert request._to_int( "7" ) == 7
+    assert request._to_int( "0x10" ) == 16
+    with pytest.raises( ValueError ):
+        request._to_int( "not-a-number" )
+
+
+def test_to_bool():
+    assert request._to_bool( True ) is True
+    assert request._to_bool( False ) is False
+    with pytest.raises( TypeError ):
+        request._to_bool( "true" )
+    with pytest.raises( TypeError ):
+        request._to_bool( None )
+
+
+def _reply( index, result ):
+    return {
+        "id": str( index ),
+        "jsonrpc": "2.0",
+        "result": result
+    }
+
+
+def test_rpc_batch_request_reorders_replies( monkeypatch ):
+    def fake_post( endpoint, payload, timeout, compress = False ):
+        sent = json.loads( payload )
+        replies = [
+            _reply( int( call[ "id" ] ), int( call[ "id" ] ) * 10 )
+            for call in sent
+        ]
+        return json.dumps( list( reversed( replies ) ) ).encode()
+
+    monkeypatch.setattr( request, "_post", fake_post )
+    calls = [ ( "itcv2_getBlockSigners", [ num ] ) for num in range( 5 ) ]
+    replies = request.rpc_batch_request( calls )
+    assert [ reply[ "result" ] for reply in replies ] == [ 0, 10, 20, 30, 40 ]
+
+
+def test_rpc_batch_request_chunks( monkeypatch ):
+    batches = []
+
+    def fake_post( endpoint, payload, timeout, compress = False ):
+        sent = json.loads( payload )
+        batches.append( len( sent ) )
+        return json.dumps(
+            [ _reply( int( call[ "id" ] ), None ) for call in sent ]
+        ).encode()
+
+    monkeypatch.setattr( request, "_post", fake_post )
+    calls = [ ( "itcv2_blockNumber", [] ) ] * 7
+    replies = request.rpc_batch_request( calls, max_batch = 3 )
+    assert batches == [ 3, 3, 1 ]
+    assert len( replies ) == 7
+
+
+def test_rpc_batch_request_entry_error( monkeypatch ):
+    def fake_post( endpoint, payload, timeout, compress = False ):
+        sent = json.loads( payload )
+        replies = [ _reply( int( call[ "id" ] ), 1 ) for call in sent ]
+        replies[ 1 ] = {
+            "id": "1",
+            "jsonrpc": "2.0",
+            "error": {
+                "code": -32000,
+                "message": "boom"
+            }
+        }
+        return json.dumps( replies ).encode()
+
+    monkeypatch.setattr( request, "_post", fake_post )
+    calls = [ ( "itcv2_getBlockSigners", [ num ] ) for num in range( 3 ) ]
+    with pytest.raises( exceptions.RPCError ):
+        request.rpc_batch_request( calls )
+
+
+def test_rpc_batch_request_batch_wide_error( monkeypatch ):
+    def fake_post( endpoint, payload, timeout, compress = False ):
+        return json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32600,
+                    "message": "invalid batch"
+                }
+            }
+        ).encode()
+
+    monkeypatch.setattr( request, "_post", fake_post )
+    with pytest.raises( exceptions.RPCError ):
+        request.rpc_batch_request( [ ( "itcv2_blockNumber", [] ) ] )